@@ -19,13 +19,22 @@ License : MIT
 # ---------- Standard Library Imports ----------
 import json
 import os
-from datetime import datetime, timedelta
+import shutil
+from datetime import date, datetime, timedelta
 import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox, filedialog
 
+# ---------- Optional Third-Party Imports ----------
+try:
+    import orjson                   # faster JSON encoding, if installed
+except ImportError:
+    orjson = None
+
 # ------------ Module‑Level Constants ----------
-DATA_FILE = "plants.json"          # default save file
-DATE_FMT   = "%Y-%m-%d"            # ISO style for persistence
+DATA_FILE = "plants.json"          # default save file (ISO dates)
+FILTER_DELAY_MS = 250              # search debounce delay
+AUTOSAVE_DELAY_MS = 500            # batch edits into one auto-save
+DUE_CHECK_MS = 60_000              # how often to check for a new day
 
 
 # ======================================================================
@@ -47,6 +56,10 @@ class Plant:
     last_fertilized : datetime
     """
 
+    __slots__ = ("name", "water_interval", "fertilize_interval",
+                 "last_watered", "last_fertilized",
+                 "_name_lower_b", "_next_water", "_next_fert")
+
     def __init__(self,
                  name: str,
                  water_interval: int,
@@ -54,29 +67,38 @@ class Plant:
                  last_watered: str | None = None,
                  last_fertilized: str | None = None):
         self.name               = name
+        # Lowercased UTF-8 name, cached for bytes substring search
+        self._name_lower_b      = name.lower().encode("utf-8")
         self.water_interval     = int(water_interval)
         self.fertilize_interval = int(fertilize_interval)
 
         # Parse saved dates or use "now" for new plants
         self.last_watered = (
-            datetime.strptime(last_watered, DATE_FMT)
+            datetime.fromisoformat(last_watered)
             if last_watered else datetime.now()
         )
         self.last_fertilized = (
-            datetime.strptime(last_fertilized, DATE_FMT)
+            datetime.fromisoformat(last_fertilized)
             if last_fertilized else datetime.now()
         )
+        self._recompute_due()
 
     # ------------------------------------------------------------------
     # Helper Methods
     # ------------------------------------------------------------------
+    def _recompute_due(self) -> None:
+        """Refresh cached due dates; call after changing care dates/intervals."""
+        self._next_water = self.last_watered + timedelta(days=self.water_interval)
+        self._next_fert  = (self.last_fertilized
+                            + timedelta(days=self.fertilize_interval))
+
     def next_water_due(self) -> datetime:
         """Return next watering date."""
-        return self.last_watered + timedelta(days=self.water_interval)
+        return self._next_water
 
     def next_fert_due(self) -> datetime:
         """Return next fertilizing date."""
-        return self.last_fertilized + timedelta(days=self.fertilize_interval)
+        return self._next_fert
 
     # ------------------------------------------------------------------
     # Convenience
@@ -87,20 +109,26 @@ class Plant:
                 f"Water by {self.next_water_due().date()}, "
                 f"Fertilize by {self.next_fert_due().date()}")
 
-    def needs_care_today(self) -> bool:
-        """True if either care action is due today or overdue."""
-        today = datetime.now().date()
-        return (self.next_water_due().date() <= today or
-                self.next_fert_due().date() <= today)
+    def needs_care_today(self, today: date | None = None) -> bool:
+        """True if either care action is due today or overdue.
+
+        Pass ``today`` when checking many plants so the clock is read once.
+        """
+        today = today or datetime.now().date()
+        return (self._next_water.date() <= today or
+                self._next_fert.date() <= today)
+
+    def _to_record(self) -> dict:
+        """Persistence record; dates are ``date`` objects.
 
-    def to_dict(self) -> dict:
-        """Serialize for JSON persistence."""
+        Needs a date-aware encoder (see PlantCareApp._serialize_plants).
+        """
         return {
             "name": self.name,
             "water_interval": self.water_interval,
             "fertilize_interval": self.fertilize_interval,
-            "last_watered": self.last_watered.strftime(DATE_FMT),
-            "last_fertilized": self.last_fertilized.strftime(DATE_FMT),
+            "last_watered": self.last_watered.date(),
+            "last_fertilized": self.last_fertilized.date(),
         }
 
 
@@ -115,15 +143,33 @@ class PlantCareApp:
         self.root = root
         self.root.title("GreenThumb – Plant Care Assistant")
         self.root.geometry("700x460")
+        # Route the title-bar close button through exit_app so the
+        # pending auto-save is flushed
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
 
         # Internal collections
         self.plants: list[Plant]         = []
-        self.filtered_plants: list[Plant] = []
+        self.filtered_plants: list[Plant] = self.plants   # alias when unfiltered
 
-        # Build UI widgets & load data
+        # Plants needing care as of self._due_day (see _update_due)
+        self._due_today: set[Plant] = set()
+        self._due_day: date = datetime.now().date()
+
+        # Pending search-filter callback (see update_filter)
+        self._filter_after_id: str | None = None
+        self._last_term: str | None = None   # term behind filtered_plants
+
+        # Auto-save state (see _schedule_save)
+        self._dirty = False
+        self._save_after_id: str | None = None
+        self._load_failed = False   # never auto-overwrite an unread file
+
+        # Build UI widgets, then load data once the window is shown
         self._build_menubar()
         self._build_widgets()
-        self.load_data()
+        self.status_var.set("Loading…")
+        self._map_bind_id = self.root.bind("<Map>", self._on_first_map, "+")
+        self.root.after(DUE_CHECK_MS, self._check_due_rollover)
 
     # ------------------------------------------------------------------
     # UI Construction
@@ -136,6 +182,7 @@ class PlantCareApp:
 
         # File menu
         file_menu.add_command(label="Save", command=self.save_data)
+        file_menu.add_command(label="Save As…", command=self.save_data_as)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.exit_app)
         menubar.add_cascade(label="File", menu=file_menu)
@@ -194,6 +241,13 @@ class PlantCareApp:
                   relief=tk.SUNKEN,
                   anchor="w").pack(side=tk.BOTTOM, fill=tk.X)
 
+    def _on_first_map(self, event: tk.Event) -> None:
+        """Queue the initial load once the main window is mapped."""
+        if event.widget is not self.root:
+            return  # child <Map> events also reach the toplevel binding
+        self.root.unbind("<Map>", self._map_bind_id)
+        self.root.after_idle(self.load_data)
+
     # ------------------------------------------------------------------
     # Menu / Dialog Actions
     # ------------------------------------------------------------------
@@ -211,19 +265,41 @@ class PlantCareApp:
     # Core Functionalities
     # ------------------------------------------------------------------
     def update_filter(self, *_) -> None:
-        """Filter list as the user types in search box."""
+        """Schedule a filter pass once the user pauses typing."""
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DELAY_MS,
+                                                self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Filter list by the current search term."""
+        self._filter_after_id = None
         term = self.search_var.get().lower()
-        self.filtered_plants = [p for p in self.plants if term in p.name.lower()]
+        if term == self._last_term:
+            return  # view already matches this term
+        self._last_term = term
+        if not term:
+            self.filtered_plants = self.plants
+        else:
+            term_b = term.encode("utf-8")
+            self.filtered_plants = [p for p in self.plants
+                                    if term_b in p._name_lower_b]
         self.refresh_list()
 
+    @staticmethod
+    def _format_line(plant: Plant, today: date | None = None) -> str:
+        """Listbox text for a plant, flagged if care is due."""
+        return plant.status() + (" ⚠️" if plant.needs_care_today(today) else "")
+
     def refresh_list(self) -> None:
         """Redraw the listbox from self.filtered_plants."""
+        today = datetime.now().date()
+        format_line = self._format_line          # avoid per-row lookup
+        lines = [format_line(p, today) for p in self.filtered_plants]
+        # One Tcl round-trip for the whole list instead of one per row
         self.listbox.delete(0, tk.END)
-        for plant in self.filtered_plants:
-            line = plant.status()
-            if plant.needs_care_today():
-                line += " ⚠️"
-            self.listbox.insert(tk.END, line)
+        if lines:
+            self.listbox.insert(tk.END, *lines)
 
     # -------------- CRUD Operations --------------
     def add_plant(self) -> None:
@@ -243,43 +319,91 @@ class PlantCareApp:
 
         new_plant = Plant(name, water, fert)
         self.plants.append(new_plant)
-        self.filtered_plants = self.plants[:]
-        self.refresh_list()
+        self._update_due(new_plant)
+        if self.filtered_plants is self.plants:
+            # Unfiltered view: only the new row needs drawing
+            self.listbox.insert(tk.END, self._format_line(new_plant))
+        else:
+            self.filtered_plants = self.plants
+            self._last_term = None  # view no longer matches the search box
+            self.refresh_list()
+        self._schedule_save()
         self.status_var.set(f"Added plant: {name}")
 
     def update_care(self) -> None:
         """Mark a selected plant as watered, fertilized, or both."""
         if not self._validate_selection():
             return
-        plant = self.filtered_plants[self.listbox.curselection()[0]]
+        idx   = self.listbox.curselection()[0]
+        plant = self.filtered_plants[idx]
         action = (simpledialog.askstring(
             "Care Update",
             "Type 'water', 'fertilize', or 'both':") or "").lower()
 
-        if "water" in action:
+        watered    = "water" in action
+        fertilized = "fertilize" in action
+        if not (watered or fertilized):
+            return  # canceled or unrecognized; nothing changed
+
+        if watered:
             plant.last_watered = datetime.now()
-        if "fertilize" in action:
+        if fertilized:
             plant.last_fertilized = datetime.now()
-
-        self.refresh_list()
+        plant._recompute_due()
+        self._update_due(plant)
+
+        # Redraw just this row and keep it selected
+        self.listbox.delete(idx)
+        self.listbox.insert(idx, self._format_line(plant))
+        self.listbox.selection_set(idx)
+        self._schedule_save()
         self.status_var.set(f"Updated care for {plant.name}")
 
     def delete_plant(self) -> None:
         """Remove selected plant after confirmation."""
         if not self._validate_selection():
             return
-        plant = self.filtered_plants[self.listbox.curselection()[0]]
+        idx   = self.listbox.curselection()[0]
+        plant = self.filtered_plants[idx]
         if messagebox.askyesno("Delete Plant",
                                f"Are you sure you want to delete '{plant.name}'?"):
-            self.plants.remove(plant)
-            self.filtered_plants.remove(plant)
-            self.refresh_list()
+            self._due_today.discard(plant)
+            if self.filtered_plants is self.plants:
+                # Unfiltered view: the row index is the list position
+                del self.plants[idx]
+            else:
+                self.plants.remove(plant)
+                del self.filtered_plants[idx]
+            self.listbox.delete(idx)
+            self._schedule_save()
             self.status_var.set(f"Deleted plant: {plant.name}")
 
     # -------------- Reminders --------------
+    def _update_due(self, plant: Plant) -> None:
+        """Add or drop *plant* from the due-today set."""
+        if plant.needs_care_today(self._due_day):
+            self._due_today.add(plant)
+        else:
+            self._due_today.discard(plant)
+
+    def _check_due_day(self) -> None:
+        """Rebuild the due-today set if the date has changed."""
+        today = datetime.now().date()
+        if today != self._due_day:
+            self._due_day   = today
+            self._due_today = {p for p in self.plants
+                               if p.needs_care_today(today)}
+            self.refresh_list()  # ⚠️ flags may have changed
+
+    def _check_due_rollover(self) -> None:
+        """Periodic day-rollover check; re-arms itself."""
+        self._check_due_day()
+        self.root.after(DUE_CHECK_MS, self._check_due_rollover)
+
     def view_reminders(self) -> None:
         """Show plants that need care today in a popup."""
-        reminders = [p.status() for p in self.plants if p.needs_care_today()]
+        self._check_due_day()
+        reminders = sorted(p.status() for p in self._due_today)
         if reminders:
             messagebox.showinfo("Today's Care Reminders", "\n".join(reminders))
         else:
@@ -290,8 +414,18 @@ class PlantCareApp:
     # Persistence
     # ------------------------------------------------------------------
     def save_data(self) -> None:
-        """Write plant list to JSON file (prompt for location if chosen)."""
-        # Allow user to pick a file if they wish
+        """Write plant list to the default JSON file, no dialog."""
+        if self._load_failed and not self._confirm_overwrite():
+            return
+        if self._save_to(DATA_FILE):
+            # Nothing left for a pending auto-save to do
+            if self._save_after_id:
+                self.root.after_cancel(self._save_after_id)
+                self._save_after_id = None
+            self._dirty = False
+
+    def save_data_as(self) -> None:
+        """Prompt for a location and write plant list there."""
         file_path = filedialog.asksaveasfilename(
             title="Save Plant Data",
             initialfile=DATA_FILE,
@@ -300,30 +434,127 @@ class PlantCareApp:
         )
         if not file_path:
             return  # canceled
+        self._save_to(file_path, pretty=True)   # human-readable export
 
+    def _save_to(self, file_path: str, pretty: bool = False) -> bool:
+        """Write plant list to *file_path*, reporting the outcome."""
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump([p.to_dict() for p in self.plants], f, indent=4)
+            self._write_plants(file_path, pretty)
             self.status_var.set(f"Data saved to {os.path.basename(file_path)}")
+            return True
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Save Error", str(exc))
             self.status_var.set("Failed to save data.")
+            return False
+
+    def _serialize_plants(self, pretty: bool = False) -> bytes:
+        """Encode the plant list as UTF-8 JSON (compact unless *pretty*)."""
+        data = [p._to_record() for p in self.plants]
+        if orjson is not None:
+            return orjson.dumps(data,
+                                option=orjson.OPT_INDENT_2 if pretty else 0)
+        if pretty:
+            return json.dumps(data, indent=4,
+                              default=date.isoformat).encode("utf-8")
+        return json.dumps(data, separators=(",", ":"),
+                          default=date.isoformat).encode("utf-8")
+
+    def _write_plants(self, file_path: str, pretty: bool = False) -> None:
+        """Atomically write the plant list to *file_path*."""
+        # Write beside the target, then swap it in so a crash never
+        # leaves a half-written file behind.
+        tmp = file_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._serialize_plants(pretty))
+        os.replace(tmp, file_path)
+
+    def _schedule_save(self) -> None:
+        """Mark data dirty and (re)arm a delayed auto-save to DATA_FILE."""
+        self._dirty = True
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(AUTOSAVE_DELAY_MS,
+                                              self._flush_save)
+
+    def _confirm_overwrite(self) -> bool:
+        """Ask before replacing a plants.json that failed to load.
+
+        On confirmation the original is kept as ``plants.json.bak``.
+        If the file has since been removed there is nothing to protect.
+        """
+        if not os.path.exists(DATA_FILE):
+            self._load_failed = False
+            return True
+        if not messagebox.askyesno(
+                "Overwrite Plant Data",
+                f"{DATA_FILE} could not be loaded. Overwrite it?\n\n"
+                f"The original will be kept as {DATA_FILE}.bak."):
+            return False
+        try:
+            shutil.copyfile(DATA_FILE, DATA_FILE + ".bak")
+        except OSError as exc:
+            messagebox.showerror("Backup Error", str(exc))
+            return False
+        self._load_failed = False
+        return True
+
+    def _flush_save(self) -> None:
+        """Write pending changes to DATA_FILE, if any."""
+        self._save_after_id = None
+        if not self._dirty:
+            return
+        if self._load_failed:
+            if os.path.exists(DATA_FILE):
+                # Leave the unreadable file alone; an explicit Save will ask
+                self.status_var.set(
+                    f"Auto-save paused: {DATA_FILE} failed to load")
+                return
+            self._load_failed = False  # bad file is gone; safe to write
+        try:
+            self._write_plants(DATA_FILE)
+            self._dirty = False
+        except Exception as exc:  # noqa: BLE001
+            self.status_var.set(f"Auto-save failed: {exc}")
 
     def load_data(self) -> None:
         """Load plant data from default JSON file, if present."""
         if not os.path.exists(DATA_FILE):
-            self.filtered_plants = self.plants[:]  # nothing to load
+            self.filtered_plants = self.plants  # nothing to load
+            self.status_var.set("Welcome to GreenThumb!")
             return
 
         try:
             with open(DATA_FILE, "r", encoding="utf-8") as f:
-                for entry in json.load(f):
-                    self.plants.append(Plant(**entry))
-            self.filtered_plants = self.plants[:]
-            self.refresh_list()
-            self.status_var.set("Data loaded from plants.json")
+                entries = json.load(f)
+            # Build into locals so a bad entry leaves no partial state.
+            # Bind hot names locally; this loop runs once per saved plant
+            plants: list[Plant] = []
+            due:    set[Plant] = set()
+            make_plant    = Plant
+            plants_append = plants.append
+            due_add       = due.add
+            today         = self._due_day
+            for entry in entries:
+                plant = make_plant(**entry)
+                plants_append(plant)
+                if plant.needs_care_today(today):
+                    due_add(plant)
         except Exception as exc:  # noqa: BLE001
+            self._load_failed = True
             messagebox.showerror("Load Error", str(exc))
+            self.status_var.set("Failed to load data.")
+            return
+
+        # Keep anything added before loading finished
+        plants.extend(self.plants)
+        due |= self._due_today
+
+        self.plants          = plants
+        self.filtered_plants = plants
+        self._due_today      = due
+        self._last_term      = None
+        self.refresh_list()
+        self.status_var.set("Data loaded from plants.json")
 
     # ------------------------------------------------------------------
     # Utility
@@ -337,7 +568,17 @@ class PlantCareApp:
         return True
 
     def exit_app(self) -> None:
-        """Gracefully quit the application."""
+        """Gracefully quit, flushing any pending auto-save first."""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._flush_save()
+        if self._dirty and not messagebox.askyesno(
+                "Unsaved Changes",
+                f"Your latest changes could not be saved to {DATA_FILE}.\n"
+                f"({self.status_var.get()})\n\n"
+                "Quit anyway and lose them?",
+                icon=messagebox.WARNING):
+            return
         self.root.quit()
 
 